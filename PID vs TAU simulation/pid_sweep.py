@@ -0,0 +1,51 @@
+"""
+Offline PID gain sweep for the heavy-inertia pump in tau_studio_wip.py.
+
+Runs the warm-started PID loop of the live sim once per (Kp, Ki, Kd) point
+of a grid over the GUI slider ranges, in parallel when numba is installed,
+and prints the best gains by mean absolute error against the setpoint.
+Run from this folder:
+
+    python pid_sweep.py
+"""
+import numpy as np
+
+from tau_studio_wip import pump_step, pid_step
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional: the sweep then runs as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]): return args[0]
+        return lambda f: f
+    prange = range
+
+@njit(parallel=True, cache=True)
+def pid_sweep(kps, kis, kds, noise, target=0.5, amp0=5.0):
+    """Returns measured flow per gain point, shape (len(kps), len(noise))."""
+    n_pts, steps = kps.shape[0], noise.shape[0]
+    traj = np.empty((n_pts, steps))
+    for k in prange(n_pts):
+        amp, vel, cmd, prev_err, integ = amp0, 0.0, amp0, 0.0, 0.0
+        for t in range(steps):
+            amp, vel, m = pump_step(amp, vel, cmd, noise[t], 1.0)
+            adj, prev_err, integ = pid_step(prev_err, integ, kps[k], kis[k], kds[k], True, target, m)
+            cmd += adj
+            cmd = 0.0 if cmd < 0.0 else (10.0 if cmd > 10.0 else cmd)
+            traj[k, t] = m
+    return traj
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0, 0.01, 600)
+    noise[200] += 2.0 # One injected spike, like the live sim's fault button
+
+    # Same ranges as the Kp / Ki / Kd sliders
+    grid = np.meshgrid(np.linspace(0.0, 10.0, 21), np.linspace(0.0, 2.0, 11),
+                       np.linspace(0.0, 5.0, 11), indexing='ij')
+    kp, ki, kd = (g.ravel() for g in grid)
+
+    score = np.abs(pid_sweep(kp, ki, kd, noise) - 0.5).mean(axis=1)
+    print(f"{len(kp)} gain points x {len(noise)} steps")
+    for k in np.argsort(score)[:5]:
+        print(f"Kp={kp[k]:4.1f}  Ki={ki[k]:4.2f}  Kd={kd[k]:4.1f}  MAE={score[k]:.4f}")
@@ -0,0 +1,35 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Compiled PistonPump + PID trace for tau_studio.py.
+
+Optional: tau_studio.py picks this up when it is built and otherwise falls
+back to its own pid_trace (numba-compiled if numba is installed). Build
+in place from this folder with:
+
+    cythonize -i pidsim.pyx
+"""
+import numpy as np
+
+cpdef tuple pid_trace(double[::1] noise, double[::1] load, double kp, double ki, double kd,
+                      bint clamp, double setpoint=0.5):
+    """Runs PistonPump + PID over a whole scenario. Returns (amp, meas) arrays."""
+    cdef Py_ssize_t n = noise.shape[0], k
+    amp_arr = np.empty(n)
+    meas_arr = np.empty(n)
+    cdef double[::1] amp_out = amp_arr
+    cdef double[::1] meas_out = meas_arr
+    cdef double amp = 0.0, pump = 0.0, prev_err = 0.0, integ = 0.0, m, err
+
+    for k in range(n):
+        pump += (amp - pump) * 0.5
+        m = (pump * 0.1 * load[k]) + noise[k]
+        if m < 0.0: m = 0.0
+        err = setpoint - m
+        integ += err
+        if clamp: integ = -50.0 if integ < -50.0 else (50.0 if integ > 50.0 else integ)
+        amp += kp * err + ki * integ + kd * (err - prev_err)
+        amp = 0.0 if amp < 0.0 else (10.0 if amp > 10.0 else amp)
+        prev_err = err
+        amp_out[k] = amp
+        meas_out[k] = m
+    return amp_arr, meas_arr
@@ -2,14 +2,21 @@ import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.animation import FuncAnimation
-import pandas as pd
 import numpy as np
 import subprocess
 import os
 import threading
 import queue
 import time
+import re
+import collections
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: fall back to plain Python kernels
+    def njit(*args, **kwargs):
+        if args and callable(args[0]): return args[0]
+        return lambda f: f
 
 # ==============================================================================
 # GLOBAL SETTINGS
@@ -67,25 +74,82 @@ TAU_CODE_ONE_LINER = ("set charvar off\ni1 : bv[8] = in console\no1 : bv[8] = ou
 # ==============================================================================
 # 1. PHYSICS & CONTROL CLASSES
 # ==============================================================================
+@njit(cache=True)
+def pump_step(amp, target, noise, load):
+    """One PistonPump tick. Returns (new_amp, measured_vol)."""
+    amp += (target - amp) * 0.5
+    vol = (amp * 0.1 * load) + noise
+    return amp, (vol if vol > 0.0 else 0.0)
+
 class PistonPump:
+    __slots__ = ('amp',)
     def __init__(self): self.amp = 0.0
     def update(self, target, noise, load):
-        self.amp += (target - self.amp) * 0.5
-        return max(0, (self.amp * 0.1 * load) + noise)
-
-class PID:
-    def __init__(self, kp, ki, kd, clamp):
-        self.kp, self.ki, self.kd = kp, ki, kd
-        self.clamp, self.prev_err, self.integral = clamp, 0, 0
-    def compute(self, setpoint, measure):
-        err = setpoint - measure
-        self.integral += err
-        if self.clamp: self.integral = max(-50, min(50, self.integral))
-        p = self.kp * err
-        i = self.ki * self.integral
-        d = self.kd * (err - self.prev_err)
-        self.prev_err = err
-        return p + i + d
+        self.amp, vol = pump_step(self.amp, target, noise, load)
+        return vol
+    @staticmethod
+    def update_vec(amp, noise, load):
+        """Measured flow for a whole trace of pump amplitudes at once."""
+        return np.maximum(0.0, amp * 0.1 * load + noise)
+
+@njit(cache=True)
+def pid_trace(noise, load, kp, ki, kd, clamp, setpoint=0.5):
+    """Runs PistonPump + PID over a whole scenario. Returns (amp, meas) arrays.
+
+    Same maths as stepping PistonPump under a PID controller (integral
+    clamped to +-50), with everything bound to locals so the loop does no
+    attribute lookups.
+    """
+    n = len(noise)
+    amp_out, meas_out = np.empty(n), np.empty(n)
+    amp, pump, prev_err, integ = 0.0, 0.0, 0.0, 0.0
+    for k in range(n):
+        pump += (amp - pump) * 0.5
+        m = (pump * 0.1 * load[k]) + noise[k]
+        if m < 0.0: m = 0.0
+        err = setpoint - m
+        integ += err
+        if clamp: integ = -50.0 if integ < -50.0 else (50.0 if integ > 50.0 else integ)
+        amp += kp * err + ki * integ + kd * (err - prev_err)
+        amp = 0.0 if amp < 0.0 else (10.0 if amp > 10.0 else amp)
+        prev_err = err
+        amp_out[k], meas_out[k] = amp, m
+    return amp_out, meas_out
+
+try:
+    import pidsim # Optional Cython build of the same loop (see pidsim.pyx)
+    pid_trace = pidsim.pid_trace
+except ImportError: pass
+
+def pid_trace_lfilter(noise, load, kp, ki, kd, clamp, setpoint=0.5):
+    """Closed-form pid_trace for the linear regime, via one scipy lfilter call.
+
+    With constant load and no clipping (measurement > 0, amplitude inside
+    0..10, integral inside +-50 when clamped) the pump + PID loop is a
+    3rd-order LTI filter driven by u = setpoint - noise. Returns None when
+    scipy is missing or any of those assumptions is violated, so callers
+    can fall back to pid_trace.
+    """
+    # Cheap rejections first. At k=0 the pump is still at rest, so meas[0] = noise[0]
+    # and a negative first sample is always clipped.
+    if noise[0] < 0.0 or not np.all(load == load[0]): return None
+    try:
+        from scipy.signal import lfilter # Lazy: scipy costs ~0.7 s of startup for a rarely taken path
+    except ImportError: return None
+    g = 0.1 * load[0]
+    # Polynomials in the delay operator q, ascending powers
+    lag = np.array([1.0, -0.5])                              # pump: P = 0.5q/(1-0.5q) C
+    d2 = np.array([1.0, -2.0, 1.0])                          # (1-q)^2
+    pid = np.array([kp + ki + kd, -kp - 2 * kd, kd])         # PID numerator over (1-q)^2
+    a = np.convolve(lag, d2) + 0.5 * g * np.concatenate(([0.0], pid))
+    u = setpoint - noise
+    err = lfilter(np.convolve(lag, d2), a, u)
+    amp = lfilter(np.convolve(pid, lag), a, u)
+    meas = setpoint - err
+    if not (np.all(np.isfinite(amp)) and meas.min() >= 0.0 and amp.min() >= 0.0 and amp.max() <= 10.0):
+        return None
+    if clamp and np.abs(np.cumsum(err)).max() > 50.0: return None
+    return amp, meas
 
 # ==============================================================================
 # 2. DEBUG CONSOLE WIDGET
@@ -95,62 +159,101 @@ class DebugConsole(tk.Frame):
         super().__init__(parent)
         self.text = scrolledtext.ScrolledText(self, height=12, bg="black", fg="#00ff00", font=("Consolas", 9))
         self.text.pack(fill=tk.BOTH, expand=True)
+        self.text.tag_config("err", foreground="#ff5555")
+        self.text.tag_config("tx", foreground="#55ffff")
         self.log(">>> TAU CONSOLE READY")
 
+    TAGS = {"red": "err", "cyan": "tx"}
+
     def log(self, msg, color=None):
-        tag = "normal"
-        if color == "red":
-            self.text.tag_config("err", foreground="#ff5555")
-            tag = "err"
-        elif color == "cyan":
-            self.text.tag_config("tx", foreground="#55ffff")
-            tag = "tx"
-            
-        self.text.insert(tk.END, msg + "\n", tag)
+        self.text.insert(tk.END, msg + "\n", self.TAGS.get(color, "normal"))
         self.text.see(tk.END)
         # self.text.update_idletasks() # Optional: Un-comment if you want live updates (slower)
-        
+
+    def log_many(self, records):
+        """Appends (msg, color) records with one insert, one tag_add per colour and one see()."""
+        if not records: return
+        base = int(self.text.index("end-1c").split('.')[0]) # Line the first record lands on
+        ranges = {}
+        for i, (_, color) in enumerate(records):
+            tag = self.TAGS.get(color)
+            if tag: ranges.setdefault(tag, []).extend((f"{base + i}.0", f"{base + i + 1}.0"))
+        self.text.insert(tk.END, "\n".join(msg for msg, _ in records) + "\n")
+        for tag, idx in ranges.items():
+            self.text.tag_add(tag, *idx)
+        self.text.see(tk.END)
+
     def clear(self):
         self.text.delete('1.0', tk.END)
 
 # ==============================================================================
 # 3. TAU INTERFACE (FLIGHT RECORDER MODE)
 # ==============================================================================
+@njit(cache=True)
+def tau_py_step(i1, prev):
+    """In-process model of TAU_CODE_ONE_LINER: one bv[8] input -> one bv[8] output."""
+    if i1 > 0x50: return prev
+    if i1 < 0x14: return 0x64
+    if prev == 0x64 and i1 < 0x1E: return 0x64
+    if i1 < 0x2D: return 0x3C
+    if i1 > 0x37: return 0x28
+    return 0x32
+
 class TauInterface:
+    # o1 assignments as printed by the REPL: hex, binary, boolean or decimal
+    _O1_RE = re.compile(rb'o1\[\d+\]\s*:=\s*(?:#x([0-9A-Fa-f]+)|#b([01]+)|([TF])|(\d+))')
+    _ANSI_RE = re.compile(rb'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+    _PROMPT_RE = re.compile(rb"tau>")
+    _EXEC_RE = re.compile(rb"Execution step|Please provide")
+    # o1 is a bv[8], so every reply maps to one of 256 amplitudes (value / 10)
+    _LUT = tuple(v / 10.0 for v in range(256))
+    # ...and every input is one of 256 pre-encoded lines
+    _HEX_IN = tuple(f"#x{v:02X}\n".encode('ascii') for v in range(256))
+
     def __init__(self, exe_path):
         self.valid = False
         self.process = None
-        self.output_queue = queue.Queue()
+        # Single producer (reader thread) / single consumer, so plain deques
+        # suffice; _rx_event wakes the consumer whenever either one grows.
+        self.output_queue = collections.deque() # Raw stdout chunks, only fed during the handshake
+        self.values = collections.deque() # Parsed o1 values
+        self._rx_event = threading.Event()
+        self._handshake = True
         self.stop_event = threading.Event()
-        self.full_log = [] # FLIGHT RECORDER: Stores everything
+        # FLIGHT RECORDER: bounded; RX/TX are stored raw and formatted in get_all_logs
+        self.full_log = collections.deque(maxlen=5000)
+        self.fallback = False # True when running the in-process Python model
+        self._prev_out = 0
         
         if not exe_path or not os.path.exists(exe_path):
-            self.full_log.append("![Sys] Tau executable not found.")
+            self.full_log.append("![Sys] Tau executable not found. Using built-in Python model of the spec.")
+            self.valid = self.fallback = True
             return
 
         try:
             # 1. Launch
             self.process = subprocess.Popen(
                 [exe_path], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE, text=True, bufsize=0
+                stderr=subprocess.PIPE, bufsize=-1
             )
             # Start Reader Thread
             threading.Thread(target=self._reader_thread, daemon=True).start()
 
             # 2. Handshake
             self.full_log.append("![Sys] Waiting for 'tau>' prompt...")
-            if not self._wait_for_log_pattern("tau>", 5.0):
+            if not self._wait_for_log_pattern(self._PROMPT_RE, 5.0):
                 self.full_log.append("![Err] Prompt timeout. Is Tau running?")
                 # We continue anyway, sometimes prompt gets eaten.
 
             # 3. Send Logic
             self.full_log.append("![Sys] Sending Logic Spec...")
-            self.process.stdin.write(TAU_CODE_ONE_LINER)
+            self.process.stdin.write(TAU_CODE_ONE_LINER.encode('ascii'))
             self.process.stdin.flush()
             
             # 4. Wait for Execution Start
-            if self._wait_for_log_pattern(["Execution step", "Please provide"], 10.0):
+            if self._wait_for_log_pattern(self._EXEC_RE, 10.0):
                 self.valid = True
+                self._handshake = False
                 self.full_log.append("![Sys] Logic Accepted. Simulation Started.")
             else:
                 self.full_log.append("![Err] Logic Rejected (Syntax Error or Timeout).")
@@ -160,64 +263,78 @@ class TauInterface:
             self.full_log.append(f"![Exc] Init Error: {e}")
 
     def _reader_thread(self):
-        """Reads stdout char by char or line by line and stores it."""
+        """Reads stdout in chunks, records complete lines and parses o1 values out of them."""
+        pending = b""
         while not self.stop_event.is_set():
             try:
-                line = self.process.stdout.readline()
-                if not line: break
-                self.output_queue.put(line)
+                chunk = self.process.stdout.read1(4096)
+                if not chunk: break
             except: break
-
-    def _wait_for_log_pattern(self, patterns, timeout):
-        """Waits for a pattern while recording logs."""
-        if isinstance(patterns, str): patterns = [patterns]
-        start = time.time()
-        while time.time() - start < timeout:
-            try:
-                while not self.output_queue.empty():
-                    line = self.output_queue.get_nowait()
-                    self.full_log.append(f"RX: {line.strip()}") # Record it!
-                    
-                    for p in patterns:
-                        if p in line: return True
-                        
-                    if "error" in line.lower():
-                        self.full_log.append(f"![Tau Error detected]: {line.strip()}")
-            except: pass
-            time.sleep(0.05)
-        return False
+            if self._handshake:
+                self.output_queue.append(chunk)
+                self._rx_event.set()
+            
+            # Only newline-terminated output is parsed, so a value split
+            # across two reads is never picked up half-written.
+            pending += chunk
+            cut = pending.rfind(b"\n") + 1
+            if not cut: continue
+            done, pending = pending[:cut], pending[cut:]
+            # Colour codes can sit between ':=' and the value; whole lines never split an escape
+            done = self._ANSI_RE.sub(b"", done)
+            
+            for line in done.splitlines():
+                self.full_log.append(("RX", line)) # Record it!
+                if b"error" in line.lower(): self.full_log.append(("ERR", line))
+            for m in self._O1_RE.finditer(done):
+                hex_val, bin_val, bool_val, dec_val = m.groups()
+                if hex_val: res = int(hex_val, 16)
+                elif bin_val: res = int(bin_val, 2)
+                elif bool_val: res = 1 if bool_val == b"T" else 0
+                else: res = int(dec_val)
+                self.values.append(res)
+            self._rx_event.set()
+        if pending: self.full_log.append(("RX", pending))
+
+    def _wait_for_log_pattern(self, pattern, timeout):
+        """Waits for a precompiled pattern to show up in the raw output."""
+        buffer = b""
+        deadline = time.time() + timeout
+        while True:
+            self._rx_event.clear()
+            while self.output_queue: buffer += self.output_queue.popleft()
+            if pattern.search(buffer): return True
+            remaining = deadline - time.time()
+            if remaining <= 0: return False
+            self._rx_event.wait(remaining)
+
+    def _read_output(self, timeout=1.0):
+        """Waits for the next o1 value. Returns it as an int, or None if Tau died or stayed silent."""
+        deadline = time.time() + timeout
+        while True:
+            self._rx_event.clear()
+            if self.values: return self.values.popleft()
+            remaining = deadline - time.time()
+            if remaining <= 0 or self.process.poll() is not None: return None
+            self._rx_event.wait(min(remaining, 0.2))
 
     def compute(self, measure_vol):
         if not self.valid: return None
         
         val_int = max(0, min(255, int(measure_vol * 100)))
-        hex_in = f"#x{val_int:02X}\n"
+        if self.fallback:
+            self._prev_out = tau_py_step(val_int, self._prev_out)
+            return self._LUT[self._prev_out]
         
         try:
-            self.process.stdin.write(hex_in)
+            self.values.clear() # Drop any answer that arrived after a previous timeout
+            self.process.stdin.write(self._HEX_IN[val_int])
             self.process.stdin.flush()
-            self.full_log.append(f"TX: {hex_in.strip()}")
+            self.full_log.append(("TX", val_int))
             
-            # Wait for response
-            while True:
-                try:
-                    line = self.output_queue.get(timeout=0.2)
-                    self.full_log.append(f"RX: {line.strip()}")
-                    
-                    if "o1[" in line and ":=" in line:
-                        parts = line.split(":=")
-                        val_part = parts[-1].strip()
-                        # Parse Hex/Bin/Dec
-                        if "#x" in val_part: res = int(val_part.replace("#x",""), 16)
-                        elif "#b" in val_part: res = int(val_part.replace("#b",""), 2)
-                        elif "T" in val_part: res = 1
-                        else: 
-                            try: res = int(val_part)
-                            except: res = 0
-                        return float(res) / 10.0
-                except queue.Empty:
-                    if self.process.poll() is not None: return None
-                    continue # Keep waiting
+            res = self._read_output()
+            if res is None: return None
+            return self._LUT[res] if res < 256 else res / 10.0
         except: return None
 
     def close(self):
@@ -225,33 +342,38 @@ class TauInterface:
         if self.process:
             try:
                 self.full_log.append("![Sys] Sending Quit Command...")
-                self.process.stdin.write("q\n")
+                self.process.stdin.write(b"q\n")
                 self.process.stdin.flush()
                 time.sleep(0.2)
                 self.process.terminate()
             except: pass
-        
-        # Drain remaining logs
-        while not self.output_queue.empty():
-            try: self.full_log.append(f"RX: {self.output_queue.get_nowait().strip()}")
-            except: break
 
     def get_all_logs(self):
-        return self.full_log
+        logs = []
+        for entry in list(self.full_log): # Snapshot: the reader thread may still append
+            if isinstance(entry, str): logs.append(entry)
+            elif entry[0] == "TX": logs.append(f"TX: #x{entry[1]:02X}")
+            elif entry[0] == "RX": logs.append(f"RX: {entry[1].decode(errors='replace').strip()}")
+            else: logs.append(f"![Tau Error detected]: {entry[1].decode(errors='replace').strip()}")
+        return logs
 
 # ==============================================================================
 # 4. GUI APPLICATION
 # ==============================================================================
 class TauStudioApp:
+    # (text, colour) per status id; None means "show the step counter"
+    STATUS_LABELS = (None, ("⚠️ GLITCH", "red"), ("⚠️ BLOCKAGE", "orange"))
+
     def __init__(self, root):
         self.root = root
         self.root.title("Tau Studio: Playback & Console")
         self.root.geometry("1400x950")
-        self.ani = None
+        self._after_id = None
         
         style = ttk.Style()
         style.configure("Header.TLabel", font=("Arial", 14, "bold"))
         style.configure("Status.TLabel", font=("Arial", 16, "bold"))
+        style.configure("Section.TLabel", font=("Arial", 10, "bold"))
         
         # --- LEFT PANEL ---
         control_frame = ttk.Frame(root, padding="15")
@@ -261,7 +383,7 @@ class TauStudioApp:
         self.tau_path = tk.StringVar()
         self.btn_load_tau = ttk.Button(control_frame, text="Locate Tau Executable...", command=self.load_tau_exe)
         self.btn_load_tau.pack(fill=tk.X, pady=5)
-        self.lbl_tau_status = ttk.Label(control_frame, text="Mode: PID ONLY", foreground="red")
+        self.lbl_tau_status = ttk.Label(control_frame, text="Mode: PID vs TAU (Python model)", foreground="orange")
         self.lbl_tau_status.pack(pady=2)
 
         ttk.Separator(control_frame).pack(fill='x', pady=10)
@@ -283,7 +405,7 @@ class TauStudioApp:
 
         # CONSOLE
         ttk.Separator(control_frame).pack(fill='x', pady=10)
-        ttk.Label(control_frame, text="Tau Execution Logs:", font=("Arial", 10, "bold")).pack(anchor="w")
+        ttk.Label(control_frame, text="Tau Execution Logs:", style="Section.TLabel").pack(anchor="w")
         self.console = DebugConsole(control_frame)
         self.console.pack(fill=tk.BOTH, expand=True, pady=5)
 
@@ -294,8 +416,14 @@ class TauStudioApp:
         self.fig.subplots_adjust(hspace=0.4, top=0.9, bottom=0.1)
         self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         self.setup_empty_plots()
 
+        # Warm the JIT kernels now so the first run doesn't pay for compilation
+        PistonPump().update(0.0, 0.0, 1.0)
+        tau_py_step(0, 0) # Python model of the spec: the default mode when no executable is chosen
+        pid_trace(np.zeros(1), np.ones(1), 1.0, 0.0, 0.0, True)
+
     def create_input(self, parent, label, default):
         frame = ttk.Frame(parent)
         frame.pack(fill=tk.X, pady=2)
@@ -312,23 +440,38 @@ class TauStudioApp:
             self.lbl_tau_status.config(text="Mode: PID vs TAU", foreground="green")
 
     def setup_empty_plots(self):
-        self.ax1.clear(); self.ax2.clear()
+        """Builds every static artist and the four trace lines once; runs only reset line data."""
         self.ax1.set_title("Volume Flow Rate")
+        self.ax1.set_ylim(-0.5, 2.0)
+        self.ax1.axhline(0.5, color='k', ls='--')
+        # Lines are animated: _tick blits them over a cached background
+        l_pid_v, = self.ax1.plot([], [], 'r-', label="PID", animated=True)
+        l_tau_v, = self.ax1.plot([], [], 'b-', label="Tau", animated=True)
+        self.ax1.legend()
         self.ax1.grid(True, alpha=0.3)
+        
         self.ax2.set_title("Controller Action")
+        self.ax2.set_ylim(0, 12)
+        l_pid_a, = self.ax2.plot([], [], 'r-', alpha=0.5, animated=True)
+        l_tau_a, = self.ax2.plot([], [], 'b-', alpha=0.5, animated=True)
         self.ax2.grid(True, alpha=0.3)
-        self.canvas.draw()
+        self._lines = (l_pid_v, l_tau_v, l_pid_a, l_tau_a)
+        self.canvas.draw_idle()
 
     def generate_scenario(self, steps, num_glitches):
-        np.random.seed(None)
-        df = pd.DataFrame({'step': range(steps), 'noise': np.random.normal(0, 0.01, steps), 'load': [1.0] * steps})
-        for _ in range(num_glitches):
-            t = np.random.randint(30, steps-30)
-            kind = np.random.choice(['spike', 'dropout', 'blockage'])
-            if kind == 'spike': df.loc[t:t+2, 'noise'] += 1.5
-            elif kind == 'dropout': df.loc[t:t+2, 'noise'] -= 0.5
-            elif kind == 'blockage': df.loc[t:t+40, 'load'] = 0.2
-        return df
+        rng = np.random.default_rng()
+        noise = rng.standard_normal(steps) * 0.01
+        load = np.ones(steps)
+
+        # Draw all glitch starts/kinds at once, then apply them as index windows
+        ts = rng.integers(30, steps-30, size=num_glitches)
+        kinds = rng.choice(['spike', 'dropout', 'blockage'], size=num_glitches)
+        np.add.at(noise, (ts[kinds == 'spike'][:, None] + np.arange(3)).ravel(), 1.5)
+        np.add.at(noise, (ts[kinds == 'dropout'][:, None] + np.arange(3)).ravel(), -0.5)
+        blocked = (ts[kinds == 'blockage'][:, None] + np.arange(41)).ravel()
+        load[blocked[blocked < steps]] = 0.2
+
+        return noise, load
 
     def run_scenario(self):
         try:
@@ -338,97 +481,144 @@ class TauStudioApp:
             speed_val = int(self.speed.get())
         except: return
 
-        if self.ani: self.ani.event_source.stop()
+        if self._after_id: self.root.after_cancel(self._after_id)
         self.btn_run.config(state="disabled")
         self.console.clear()
         self.console.log("--- COMPUTING... ---")
         self.lbl_status.config(text="Computing...", foreground="blue")
-        self.root.update()
-        
-        df = self.generate_scenario(steps, n_glitch)
-        
-        plant_pid = PistonPump()
-        plant_tau = PistonPump()
-        pid = PID(kp, 0.5, 1.0, True)
-        tau = TauInterface(self.tau_path.get())
-        
-        amp_pid, amp_tau = 0.0, 0.0
-        
-        self.history = {'x':[], 'pid_v':[], 'tau_v':[], 'pid_a':[], 'tau_a':[], 'status':[]}
         self.progress['maximum'] = steps
-
-        for i in range(steps):
-            self.progress['value'] = i
-            # Update GUI every 10 steps to stay responsive but fast
-            if i % 10 == 0: self.root.update()
-            
-            row = df.iloc[i]
-            
-            # PID
-            m_p = plant_pid.update(amp_pid, row['noise'], row['load'])
-            amp_pid = max(0, min(10, amp_pid + pid.compute(0.5, m_p)))
-            
-            # Tau
-            m_t = plant_tau.update(amp_tau, row['noise'], row['load'])
-            tgt = tau.compute(m_t)
+        self.progress['value'] = 0
+        
+        # Tau I/O runs off the Tk thread; progress comes back through a queue
+        self._progress_q = queue.Queue()
+        tau_path = self.tau_path.get() # Read Tk state here, on the Tk thread
+        threading.Thread(target=self._compute_worker, args=(steps, n_glitch, kp, tau_path), daemon=True).start()
+        self.root.after(50, self._poll_progress, steps, speed_val)
+
+    def _compute_worker(self, steps, n_glitch, kp, tau_path):
+        """Computes the scenario in a background thread. Never touches Tk."""
+        try:
+            noise_arr, load_arr = self.generate_scenario(steps, n_glitch)
             
-            # If Tau is valid, update. If not (flatline issue), keep 0.
-            if tgt is not None: amp_tau = tgt
+            plant_tau = PistonPump()
+            tau = TauInterface(tau_path)
             
-            self.history['x'].append(i)
-            self.history['pid_v'].append(m_p)
-            self.history['tau_v'].append(m_t)
-            self.history['pid_a'].append(amp_pid)
-            self.history['tau_a'].append(amp_tau)
+            amp_tau = 0.0
             
-            st = "Normal"
-            if abs(row['noise']) > 0.5: st = "GLITCH"
-            elif row['load'] < 0.9: st = "BLOCKAGE"
-            self.history['status'].append(st)
+            history = {k: np.empty(steps) for k in ('tau_v', 'tau_a')}
+            # PID does not depend on Tau, so its whole trace is computed up front
+            pid_args = (noise_arr, load_arr, kp, 0.5, 1.0, True)
+            history['pid_a'], history['pid_v'] = pid_trace_lfilter(*pid_args) or pid_trace(*pid_args)
+            history['x'] = np.arange(steps)
+            # Status per step: 0 = Normal, 1 = GLITCH, 2 = BLOCKAGE (see STATUS_LABELS)
+            status = np.zeros(steps, dtype=np.int8)
+            status[load_arr < 0.9] = 2
+            status[np.abs(noise_arr) > 0.5] = 1
+            history['status'] = status
+
+            if not tau.valid:
+                # No Tau: the command stays at 0 so the pump never moves and
+                # the whole open-loop response is one vectorized expression.
+                history['tau_a'][:] = 0.0
+                history['tau_v'][:] = PistonPump.update_vec(history['tau_a'], noise_arr, load_arr)
+                self._progress_q.put(steps - 1)
+            else:
+                for i in range(steps):
+                    self._progress_q.put(i)
+                    
+                    # Tau
+                    m_t = plant_tau.update(amp_tau, noise_arr[i], load_arr[i])
+                    tgt = tau.compute(m_t)
+                    
+                    # If Tau is valid, update. If not (flatline issue), keep 0.
+                    if tgt is not None: amp_tau = tgt
+                    
+                    history['tau_v'][i] = m_t
+                    history['tau_a'][i] = amp_tau
+
+            self.history = history
+            self._logs = list(tau.get_all_logs())
+            tau.close()
+            self._progress_q.put(None) # Sentinel: done
+        except Exception as e:
+            self._progress_q.put(e)
+
+    def _poll_progress(self, steps, speed):
+        """Drains worker progress on the Tk thread; starts playback once it's done."""
+        result = False
+        try:
+            while True:
+                item = self._progress_q.get_nowait()
+                if isinstance(item, int): self.progress['value'] = item
+                else: result = item
+        except queue.Empty: pass
+        
+        if result is False:
+            self.root.after(50, self._poll_progress, steps, speed)
+            return
+        
+        self.btn_run.config(state="normal")
+        if result is not None:
+            self.console.log(f"![Exc] Compute Error: {result}", "red")
+            self.lbl_status.config(text="Error", foreground="red")
+            return
 
         # DUMP LOGS at the end
-        logs = tau.get_all_logs()
-        for l in logs:
-            col = "cyan" if "TX" in l else "red" if "Err" in l else None
-            self.console.log(l, col)
+        self.console.log_many([(l, "cyan" if "TX" in l else "red" if "Err" in l else None)
+                               for l in self._logs])
 
-        tau.close()
         self.lbl_status.config(text="Playing...", foreground="green")
-        self.btn_run.config(state="normal")
-        self.play_animation(steps, speed_val)
+        self.play_animation(steps, speed)
 
     def play_animation(self, steps, speed):
-        self.ax1.clear(); self.ax2.clear()
-        self.ax1.set_xlim(0, steps); self.ax1.set_ylim(-0.5, 2.0)
+        # Axes and lines persist between runs: just empty the lines and rescale x
+        for line in self._lines:
+            line.set_data([], [])
+            line.set_animated(True)
+        self.ax1.set_xlim(0, steps); self.ax2.set_xlim(0, steps)
         self.ax1.set_title("Playback: Volume Flow Rate")
-        self.ax1.axhline(0.5, color='k', ls='--')
-        l_pid_v, = self.ax1.plot([], [], 'r-', label="PID")
-        l_tau_v, = self.ax1.plot([], [], 'b-', label="Tau")
-        self.ax1.legend()
-        self.ax1.grid(True, alpha=0.3)
-        
-        self.ax2.set_xlim(0, steps); self.ax2.set_ylim(0, 12)
-        self.ax2.set_title("Controller Action")
-        l_pid_a, = self.ax2.plot([], [], 'r-', alpha=0.5)
-        l_tau_a, = self.ax2.plot([], [], 'b-', alpha=0.5)
-        self.ax2.grid(True, alpha=0.3)
 
-        def update(f):
-            x = self.history['x'][:f]
-            l_pid_v.set_data(x, self.history['pid_v'][:f])
-            l_tau_v.set_data(x, self.history['tau_v'][:f])
-            l_pid_a.set_data(x, self.history['pid_a'][:f])
-            l_tau_a.set_data(x, self.history['tau_a'][:f])
-            
-            st = self.history['status'][f]
-            if st == "GLITCH": self.lbl_status.config(text="⚠️ GLITCH", foreground="red")
-            elif st == "BLOCKAGE": self.lbl_status.config(text="⚠️ BLOCKAGE", foreground="orange")
-            else: self.lbl_status.config(text=f"Step {f}/{steps}", foreground="black")
-            
-            return l_pid_v, l_tau_v, l_pid_a, l_tau_a
+        self._play_steps, self._speed = steps, speed
+        self._last_status = None
+        # Coalesce with any pending redraw. Idle callbacks run in order, so the
+        # first tick only fires after that draw, once _on_draw has cached the background.
+        self.canvas.draw_idle()
+        self._after_id = self.root.after_idle(self._tick, 0)
+
+    def _on_draw(self, event):
+        """Re-caches the blit background after every full redraw (e.g. resize)."""
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        for line in self._lines:
+            if line.get_animated(): line.axes.draw_artist(line)
+
+    def _tick(self, f):
+        steps = self._play_steps
+        if f >= steps:
+            # Hand the finished traces back to normal draws
+            for line in self._lines: line.set_animated(False)
+            self.canvas.draw_idle()
+            self._after_id = None
+            return
 
-        self.ani = FuncAnimation(self.fig, update, frames=range(steps), interval=speed, blit=False, repeat=False)
-        self.canvas.draw()
+        x = self.history['x'][:f]
+        l_pid_v, l_tau_v, l_pid_a, l_tau_a = self._lines
+        l_pid_v.set_data(x, self.history['pid_v'][:f])
+        l_tau_v.set_data(x, self.history['tau_v'][:f])
+        l_pid_a.set_data(x, self.history['pid_a'][:f])
+        l_tau_a.set_data(x, self.history['tau_a'][:f])
+        
+        # Only touch the Tk label when the status changes; the step
+        # counter itself is refreshed every 10 frames.
+        sid = self.history['status'][f]
+        if sid != self._last_status or (sid == 0 and f % 10 == 0):
+            text, color = self.STATUS_LABELS[sid] or (f"Step {f}/{steps}", "black")
+            self.lbl_status.config(text=text, foreground=color)
+            self._last_status = sid
+
+        self.canvas.restore_region(self._bg)
+        for line in self._lines: line.axes.draw_artist(line)
+        self.canvas.blit(self.fig.bbox)
+        self._after_id = self.root.after(self._speed, self._tick, f + 1)
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -3,14 +3,20 @@ from tkinter import ttk, filedialog, scrolledtext
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.animation import FuncAnimation
-import pandas as pd
 import numpy as np
 import subprocess
 import os
-import threading
-import queue
+import selectors
 import time
 import re
+import itertools
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional: fall back to plain Python kernels
+    def njit(*args, **kwargs):
+        if args and callable(args[0]): return args[0]
+        return lambda f: f
 
 # ==============================================================================
 # 0. ROBUST TAU LOGIC (Dynamic Target)
@@ -39,60 +45,81 @@ TAU_CODE_ONE_LINER = (
 # ==============================================================================
 # 1. PHYSICS (Heavy Inertia)
 # ==============================================================================
+@njit(cache=True)
+def pump_step(amp, velocity, target_force, noise, load):
+    """One heavy-inertia PistonPump tick. Returns (amp, velocity, measured_vol)."""
+    force = target_force - (amp * 0.5)
+    velocity = (velocity + force * 0.1) * 0.9
+    amp += velocity
+    amp = 0.0 if amp < 0.0 else (20.0 if amp > 20.0 else amp)
+    vol = (amp * 0.1 * load) + noise
+    return amp, velocity, (vol if vol > 0.0 else 0.0)
+
+@njit(cache=True)
+def pid_step(prev_err, integ, kp, ki, kd, clamp, setpoint, measure):
+    """One PID tick. Returns (adjustment, prev_err, integral)."""
+    err = setpoint - measure
+    integ += err
+    if clamp: integ = -20.0 if integ < -20.0 else (20.0 if integ > 20.0 else integ) # Tighter clamp
+    return kp * err + ki * integ + kd * (err - prev_err), err, integ
+
 class PistonPump:
+    __slots__ = ('amp', 'velocity')
+
     def __init__(self): 
         self.amp = 0.0      
         self.velocity = 0.0 
 
     def update(self, target_force, noise, load):
-        force = target_force - (self.amp * 0.5) 
-        accel = force * 0.1 
-        self.velocity += accel
-        self.velocity *= 0.9 
-        self.amp += self.velocity
-        self.amp = max(0, min(20, self.amp))
-        return max(0, (self.amp * 0.1 * load) + noise)
+        self.amp, self.velocity, vol = pump_step(self.amp, self.velocity, target_force, noise, load)
+        return vol
 
 class PID:
+    __slots__ = ('kp', 'ki', 'kd', 'clamp', 'prev_err', 'integral')
     def __init__(self, kp, ki, kd, clamp):
         self.kp, self.ki, self.kd = kp, ki, kd
-        self.clamp, self.prev_err, self.integral = clamp, 0, 0
+        self.clamp, self.prev_err, self.integral = clamp, 0.0, 0.0
     def compute(self, setpoint, measure):
-        err = setpoint - measure
-        self.integral += err
-        if self.clamp: self.integral = max(-20, min(20, self.integral)) # Tighter clamp
-        p = self.kp * err
-        i = self.ki * self.integral
-        d = self.kd * (err - self.prev_err)
-        self.prev_err = err
-        return p + i + d
+        adj, self.prev_err, self.integral = pid_step(self.prev_err, self.integral, self.kp, self.ki,
+                                                     self.kd, self.clamp, setpoint, measure)
+        return adj
 
 # ==============================================================================
 # 2. DEBUG CONSOLE
 # ==============================================================================
 class DebugConsole(tk.Frame):
+    TAGS = {"red": "err", "cyan": "tx", "yellow": "warn"}
+
     def __init__(self, parent):
         super().__init__(parent)
         self.text = scrolledtext.ScrolledText(self, height=12, bg="black", fg="#00ff00", font=("Consolas", 9))
         self.text.pack(fill=tk.BOTH, expand=True)
+        self.text.tag_config("err", foreground="#ff5555")
+        self.text.tag_config("tx", foreground="#55ffff")
+        self.text.tag_config("warn", foreground="yellow")
+        self._pending = [] # (msg, tag) waiting for the next flush
+        self._flush_scheduled = False
         self.log(">>> SYSTEM READY")
 
     def log(self, msg, color=None):
-        tag = "normal"
-        if color == "red":
-            self.text.tag_config("err", foreground="#ff5555")
-            tag = "err"
-        elif color == "cyan":
-            self.text.tag_config("tx", foreground="#55ffff")
-            tag = "tx"
-        elif color == "yellow":
-            self.text.tag_config("warn", foreground="yellow")
-            tag = "warn"
-            
-        self.text.insert(tk.END, msg + "\n", tag)
+        # Buffered: bursts of log calls cost one insert + one scroll per 100 ms
+        self._pending.append((msg, self.TAGS.get(color, "normal")))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(100, self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        if not self._pending: return
+        chunks = [] # insert(index, text, tag, text, tag, ...): one run per same-tag stretch
+        for tag, run in itertools.groupby(self._pending, key=lambda r: r[1]):
+            chunks += ["".join(msg + "\n" for msg, _ in run), tag]
+        self._pending.clear()
+        self.text.insert(tk.END, *chunks)
         self.text.see(tk.END)
         
     def clear(self):
+        self._pending.clear()
         self.text.delete('1.0', tk.END)
 
 
@@ -100,11 +127,25 @@ class DebugConsole(tk.Frame):
 # 3. TAU INTERFACE (REGEX HARDENED)
 # ==============================================================================
 class TauInterface:
+    # Compiled once, reused by every handshake / submit() / poll() call
+    # Pipes are binary: everything is matched as bytes and only decoded for the logger
+    _ANSI_RE = re.compile(rb'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+    _PROMPT_RE = re.compile(rb"tau>")
+    _EXEC_RE = re.compile(rb"Execution step|Please provide")
+    _PREFIX = {b'#x': 16, b'#b': 2} # Literal prefix -> base
+    _BOOL = {b'T': 1, b'F': 0}
+    _HEX_IN = tuple(f"#x{v:02X}\n".encode('ascii') for v in range(256)) # Pre-encoded i1/i2 lines
+
     def __init__(self, exe_path, logger_callback=None):
         self.valid = False
         self.process = None
-        self.output_queue = queue.Queue()
-        self.stop_event = threading.Event()
+        self.selector = selectors.DefaultSelector()
+        self._rx = bytearray() # Unconsumed stdout bytes, ANSI codes already stripped
+        self._err = b"" # Partial stderr line
+        self._last = None # Last o1 Tau produced (raw int)
+        self._steady = set() # (val_m, val_t, o1) steps where Tau just repeated o1
+        self._pending = None # (val_m, val_t) of the step in flight
+        self._ready = None # Memo answer for the step in flight
         self.logger = logger_callback
         
         if not exe_path or not os.path.exists(exe_path):
@@ -115,22 +156,24 @@ class TauInterface:
             self.process = subprocess.Popen(
                 [exe_path], 
                 stdin=subprocess.PIPE, stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE, text=True, bufsize=0
+                stderr=subprocess.PIPE, bufsize=0
             )
             
-            threading.Thread(target=self._stdout_reader, daemon=True).start()
-            threading.Thread(target=self._stderr_reader, daemon=True).start()
+            # Both pipes are polled from the calling thread: no reader threads, no queue
+            for stream, name in ((self.process.stdout, "out"), (self.process.stderr, "err")):
+                os.set_blocking(stream.fileno(), False)
+                self.selector.register(stream.fileno(), selectors.EVENT_READ, name)
 
             if self.logger: self.logger("![Sys] Initializing...", "yellow")
 
             # Initial handshake
-            if not self._wait_for_regex(r"tau>", 5.0):
+            if not self._wait_for_regex(self._PROMPT_RE, 5.0):
                  if self.logger: self.logger("![Warn] Prompt check skipped...", "yellow")
 
-            self.process.stdin.write(TAU_CODE_ONE_LINER)
+            self.process.stdin.write(TAU_CODE_ONE_LINER.encode('ascii'))
             self.process.stdin.flush()
             
-            if self._wait_for_regex(r"Execution step|Please provide", 20.0):
+            if self._wait_for_regex(self._EXEC_RE, 20.0):
                 self.valid = True
                 if self.logger: self.logger("![Sys] Logic Accepted.", "green")
             else:
@@ -140,109 +183,141 @@ class TauInterface:
         except Exception as e:
             if self.logger: self.logger(f"![Exc] {e}", "red")
 
-    def _stdout_reader(self):
-        while not self.stop_event.is_set():
-            try:
-                char = self.process.stdout.read(1)
-                if not char: break
-                self.output_queue.put(char)
-            except: break
-
-    def _stderr_reader(self):
-        while not self.stop_event.is_set():
-            try:
-                line = self.process.stderr.readline()
-                if not line: break
-                # Only log unexpected errors
-                if "Error" in line or "fail" in line:
-                    if self.logger: self.logger(f"[LOG] {line.strip()}", "yellow")
-            except: break
-
-    def _clean_text(self, text):
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+    def _poll(self, timeout):
+        """Waits up to timeout for either pipe and reads whatever is there. False once stdout hits EOF."""
+        for key, _ in self.selector.select(max(0.0, timeout)):
+            name = key.data
+            try: chunk = os.read(key.fd, 4096)
+            except BlockingIOError: continue
+            if not chunk:
+                self.selector.unregister(key.fd)
+                if name == "out": return False
+                continue
+            if name == "out":
+                self._rx += self._ANSI_RE.sub(b'', chunk) # Clean each chunk once, on arrival
+                continue
+            # stderr: only log unexpected errors, one complete line at a time
+            *lines, self._err = (self._err + chunk).split(b"\n")
+            for line in lines:
+                if b"Error" in line or b"fail" in line:
+                    if self.logger: self.logger(f"[LOG] {line.decode(errors='replace').strip()}", "yellow")
+        return True
 
     def _wait_for_regex(self, pattern, timeout):
-        start = time.time()
-        buffer = ""
-        while time.time() - start < timeout:
-            while not self.output_queue.empty():
-                buffer += self.output_queue.get()
-            if re.search(pattern, self._clean_text(buffer)): return True
-            time.sleep(0.05)
-        return False
-
-    def _read_until_token(self, token, timeout=0.5):
-        """Waits until a specific string appears in the buffer."""
-        buffer = ""
-        start = time.time()
-        while time.time() - start < timeout:
-            while not self.output_queue.empty():
-                buffer += self.output_queue.get()
-            if token in self._clean_text(buffer): return buffer
-            time.sleep(0.001)
-        return buffer
-
-    def compute(self, measure_vol, target_vol):
-        if not self.valid: return None
+        """Blocks in select() until pattern shows up on stdout or timeout. Each wake-up only
+        searches the new bytes (plus a little overlap for a match split across reads).
+        Consumes up to the match (everything on timeout)."""
+        deadline = time.monotonic() + timeout
+        pos = 0
+        while True:
+            m = pattern.search(self._rx, pos)
+            if m:
+                del self._rx[:m.end()] # Anything past the match stays for the next read
+                return True
+            pos = max(0, len(self._rx) - 32) # 32 > longest handshake literal
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._poll(remaining):
+                self._rx.clear()
+                return False
+
+    _SEEK_O1, _SEEK_EQ, _AFTER_EQ, _READ_VAL = range(4)
+    _SPACE = frozenset(b" \t\r\n")
+    _LITERAL = frozenset(b"#xXbB0123456789abcdefABCDEFTF") # Anything else is not a bv literal
+
+    def _read_o1(self, timeout):
+        """One pass over the receive buffer for "o1[n] := <literal>": find() skips ahead to
+        'o1' and ':=', then bytes are walked until the literal ends. State survives across
+        polls, so bytes already scanned are never rescanned. Returns the literal, or None on
+        timeout (the buffer is kept, so a late answer is still found next time). A value holding
+        a byte no literal can contain (e.g. a split ANSI escape) is dropped and returned as b""."""
+        deadline = time.monotonic() + timeout
+        state, pos, start = self._SEEK_O1, 0, 0
+        while True:
+            buf = self._rx
+            if state == self._SEEK_O1:
+                idx = buf.find(b"o1", pos)
+                if idx >= 0: state, pos = self._SEEK_EQ, idx + 2
+                else: pos = max(0, len(buf) - 1) # 'o' may be the last byte so far
+            if state == self._SEEK_EQ:
+                idx = buf.find(b":=", pos)
+                if idx >= 0: state, pos = self._AFTER_EQ, idx + 2
+                else: pos = max(pos, len(buf) - 1)
+            while state == self._AFTER_EQ and pos < len(buf):
+                if buf[pos] in self._SPACE: pos += 1
+                else: state, start = self._READ_VAL, pos
+            while state == self._READ_VAL and pos < len(buf):
+                if buf[pos] in self._SPACE:
+                    literal = bytes(buf[start:pos])
+                    del self._rx[:pos]
+                    return literal
+                if buf[pos] not in self._LITERAL:
+                    del self._rx[:pos] # Drop the bad value; the next scan seeks a fresh 'o1'
+                    return b""
+                pos += 1
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._poll(remaining): return None
+
+    def submit(self, measure_vol, target_vol):
+        """Sends one step's inputs and returns straight away; collect the answer with poll().
+        Only one step is in flight at a time: returns False if the last one is still pending."""
+        if not self.valid or self._pending is not None: return False
         
         # 1. Format Inputs (Strict Bitvector Hex)
         # ensure we send integer hex (e.g. #x1F) not float strings
         val_m = max(0, min(255, int(measure_vol * 100)))
         val_t = max(0, min(255, int(target_vol * 100)))
+        self._pending = (val_m, val_t)
         
-        hex_m = f"#x{val_m:02X}\n"
-        hex_t = f"#x{val_t:02X}\n"
-        
+        # MEMO: the spec only looks at i1[t], i2[t] and o1[t-1], so if these inputs once made Tau
+        # repeat its last output, they will again. Skipping the step is safe because o1 doesn't change.
+        if (val_m, val_t, self._last) in self._steady:
+            self._ready = self._last
+            return True
+
         try:
-            # STEP 1: Wait for i1 -> Send i1
-            self._read_until_token("i1", 1.0)
-            self.process.stdin.write(hex_m)
+            # i1 and i2 go out together: Tau reads them off the pipe as it prompts for each
+            self.process.stdin.write(self._HEX_IN[val_m] + self._HEX_IN[val_t])
             self.process.stdin.flush()
+            return True
+        except Exception as e:
+            self._pending = None
+            if self.logger: self.logger(f"![IO] {e}", "red")
+            return False
+
+    def poll(self, timeout=0.0):
+        """Returns the submitted step's output, or None if it hasn't arrived within timeout."""
+        if self._pending is None: return None
+        if self._ready is not None:
+            res, self._ready, self._pending = self._ready, None, None
+            return res / 10.0
+        
+        try:
+            self._poll(0.0) # Drain whatever is already in the pipe
+            # Wait for o1 output and pull the literal out in the same pass
+            # Handles values like: #x32, #b0101, 0, T
+            val_part = self._read_o1(timeout)
+            if val_part is None: return None # Not here yet: stays pending for the next poll
             
-            # STEP 2: Wait for i2 -> Send i2
-            self._read_until_token("i2", 1.0)
-            self.process.stdin.write(hex_t)
-            self.process.stdin.flush()
-            
-            # STEP 3: Wait for o1 output
-            # We read enough buffer to ensure we capture the value
-            # We do NOT use split() here to avoid crashes.
-            response = self._read_until_token("o1", 0.5)
-            
-            # Continue reading a bit more if we have the prompt but not the value
-            if ":=" in response and not re.search(r":=\s*([#\w]+)", response):
-                 time.sleep(0.05) # Tiny wait for the value to arrive
-                 while not self.output_queue.empty():
-                     response += self.output_queue.get()
-            
-            # STEP 4: Regex Parse (The Crash Fix)
-            # Looks for ":= " followed by any word chars or #
-            clean_resp = self._clean_text(response)
-            
-            # Match patterns like: := #x32, := 0, := T
-            match = re.search(r":=\s*([#]?[xXbB]?[0-9a-fA-F]+|T|F)", clean_resp)
+            # if self.logger: self.logger(f"RX: {val_part}", "normal") # Debug print
             
-            if match:
-                val_part = match.group(1).strip()
-                
-                # if self.logger: self.logger(f"RX: {val_part}", "normal") # Debug print
-                
-                if "#x" in val_part: res = int(val_part.replace("#x",""), 16)
-                elif "#b" in val_part: res = int(val_part.replace("#b",""), 2)
-                elif "T" in val_part: res = 1
-                elif "F" in val_part: res = 0
-                else: 
-                    try: res = int(val_part)
-                    except: res = 0
-                
-                return float(res) / 10.0
-            else:
-                # If regex failed, it means we didn't get a valid value yet.
-                # Return None (safe fail) instead of crashing.
+            base = self._PREFIX.get(val_part[:2])
+            try:
+                if base: res = int(val_part[2:], base)
+                elif val_part in self._BOOL: res = self._BOOL[val_part]
+                else: res = int(val_part)
+            except ValueError:
+                # Unrecognised literal: the step is answered with nothing, the caller holds its last command
+                self._pending = None
                 return None
+            
+            if res == self._last:
+                if len(self._steady) >= 65536: self._steady.clear()
+                self._steady.add(self._pending + (res,))
+            self._last, self._pending = res, None
+            return res / 10.0
                 
         except Exception as e:
+            self._pending = None
             if self.logger: self.logger(f"![IO] {e}", "red")
             return None
 
@@ -260,6 +335,7 @@ class TauStudioApp:
         
         style = ttk.Style()
         style.configure("Header.TLabel", font=("Arial", 12, "bold"))
+        style.configure("Section.TLabel", font=("Arial", 10, "bold"))
         
         # --- LEFT PANEL ---
         control_frame = ttk.Frame(root, padding="15")
@@ -274,15 +350,17 @@ class TauStudioApp:
         ttk.Separator(control_frame).pack(fill='x', pady=10)
         
         # CONTROLS
-        ttk.Label(control_frame, text="TARGET SETPOINT", font=("Arial", 10, "bold")).pack(anchor="w")
-        self.target_scale = tk.Scale(control_frame, from_=0.2, to=0.8, resolution=0.01, orient=tk.HORIZONTAL, length=250)
-        self.target_scale.set(0.5)
+        ttk.Label(control_frame, text="TARGET SETPOINT", style="Section.TLabel").pack(anchor="w")
+        self.target_var = tk.DoubleVar(value=0.5)
+        self._target = 0.5
+        self.target_scale = tk.Scale(control_frame, from_=0.2, to=0.8, resolution=0.01, orient=tk.HORIZONTAL, length=250,
+                                     variable=self.target_var)
         self.target_scale.pack(pady=5)
 
         ttk.Label(control_frame, text="PID Tuning:", style="Header.TLabel").pack(anchor="w", pady=(10,0))
-        self.kp_scale = self.create_slider(control_frame, "Kp (Power)", 0.0, 10.0, 4.0)
-        self.ki_scale = self.create_slider(control_frame, "Ki (Correct)", 0.0, 2.0, 0.1)
-        self.kd_scale = self.create_slider(control_frame, "Kd (Dampen)", 0.0, 5.0, 2.5)
+        self.kp_var = self.create_slider(control_frame, "Kp (Power)", 0.0, 10.0, 4.0)
+        self.ki_var = self.create_slider(control_frame, "Ki (Correct)", 0.0, 2.0, 0.1)
+        self.kd_var = self.create_slider(control_frame, "Kd (Dampen)", 0.0, 5.0, 2.5)
 
         ttk.Separator(control_frame).pack(fill='x', pady=10)
 
@@ -290,8 +368,8 @@ class TauStudioApp:
         self.btn_glitch.pack(fill=tk.X, pady=5)
 
         ttk.Label(control_frame, text="Sim Speed (ms):").pack(anchor="w")
-        self.speed_scale = tk.Scale(control_frame, from_=10, to=500, orient=tk.HORIZONTAL)
-        self.speed_scale.set(50)
+        self.speed_var = tk.IntVar(value=50)
+        self.speed_scale = tk.Scale(control_frame, from_=10, to=500, orient=tk.HORIZONTAL, variable=self.speed_var)
         self.speed_scale.pack(fill=tk.X)
 
         self.btn_run = ttk.Button(control_frame, text="▶ START LIVE SIM", command=self.toggle_simulation)
@@ -309,12 +387,27 @@ class TauStudioApp:
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         self.setup_empty_plots()
 
+        # Slider values are pushed on change instead of read back from Tk every frame
+        self.target_var.trace_add('write', lambda *_: setattr(self, '_target', self.target_var.get()))
+        for gain, var in (('kp', self.kp_var), ('ki', self.ki_var), ('kd', self.kd_var)):
+            var.trace_add('write', lambda *_, gain=gain, var=var: self._set_gain(gain, var.get()))
+        self.speed_var.trace_add('write', lambda *_: self._set_speed(self.speed_var.get()))
+
+        # Warm the JIT kernels now so the first live frame doesn't stall on compilation
+        PistonPump().update(5.0, 0.0, 1.0)
+        PID(1.0, 0.0, 0.0, True).compute(0.5, 0.5)
+
     def create_slider(self, parent, label, vmin, vmax, vdef):
         ttk.Label(parent, text=label).pack(anchor="w")
-        s = tk.Scale(parent, from_=vmin, to=vmax, resolution=0.1, orient=tk.HORIZONTAL)
-        s.set(vdef)
-        s.pack(fill=tk.X)
-        return s
+        var = tk.DoubleVar(value=vdef)
+        tk.Scale(parent, from_=vmin, to=vmax, resolution=0.1, orient=tk.HORIZONTAL, variable=var).pack(fill=tk.X)
+        return var
+
+    def _set_gain(self, gain, value):
+        if hasattr(self, 'pid'): setattr(self.pid, gain, value)
+
+    def _set_speed(self, ms):
+        if self.ani: self.ani.event_source.interval = ms
 
     def load_tau_exe(self):
         f = filedialog.askopenfilename()
@@ -325,14 +418,23 @@ class TauStudioApp:
     def trigger_glitch(self): self.manual_glitch = True
     
     def setup_empty_plots(self):
-        self.ax1.clear(); self.ax2.clear()
+        """Builds the axes and the five trace lines once; runs only reset their data."""
         self.ax1.set_title("Response Comparison")
         self.ax1.set_xlim(0, 300); self.ax1.set_ylim(-0.1, 1.1)
         self.ax1.grid(True, alpha=0.3)
         self.ax2.set_title("Controller Action")
         self.ax2.set_xlim(0, 300); self.ax2.set_ylim(0, 12)
         self.ax2.grid(True, alpha=0.3)
-        self.canvas.draw()
+        
+        self.line_target, = self.ax1.plot([], [], 'g--', label="Target", linewidth=2)
+        self.line_pid, = self.ax1.plot([], [], 'r-', label="PID")
+        self.line_tau, = self.ax1.plot([], [], 'b-', label="Tau")
+        self.ax1.legend()
+        
+        self.line_pid_a, = self.ax2.plot([], [], 'r-', alpha=0.5)
+        self.line_tau_a, = self.ax2.plot([], [], 'b-', alpha=0.5)
+        self._lines = (self.line_target, self.line_pid, self.line_tau, self.line_pid_a, self.line_tau_a)
+        self.canvas.draw_idle()
 
     def toggle_simulation(self):
         if self.is_running: self.stop_simulation()
@@ -351,7 +453,7 @@ class TauStudioApp:
         
         self.plant_pid = PistonPump()
         self.plant_tau = PistonPump()
-        self.pid = PID(self.kp_scale.get(), self.ki_scale.get(), self.kd_scale.get(), True)
+        self.pid = PID(self.kp_var.get(), self.ki_var.get(), self.kd_var.get(), True)
         
         # Pass console logger to interface
         self.tau_interface = TauInterface(self.tau_path.get(), self.console.log)
@@ -366,40 +468,39 @@ class TauStudioApp:
         self.plant_tau.amp = 5.0
         
         self.step_idx = 0
+        self._tau_skipped = 0 # Frames whose measurement Tau never saw (it was still on the previous one)
+        # Sensor noise is drawn in blocks and indexed per frame
+        self._rng = np.random.default_rng()
+        self._noise_buf = self._rng.normal(0, 0.01, 4096)
+        self._noise_idx = 0
         try: self.window_size = int(self.entry_window.get())
         except: self.window_size = 300
         
-        self.data_x, self.data_target = [], []
-        self.data_pid_v, self.data_tau_v = [], []
-        self.data_pid_a, self.data_tau_a = [], []
+        # Rolling window, one row per series: x, target, pid_v, tau_v, pid_a, tau_a.
+        # Lines get array views of it, so matplotlib never converts Python lists.
+        self._buf = np.empty((6, self.window_size))
+        self._n = 0 # Valid columns
         
-        self.ax1.clear(); self.ax2.clear()
+        for line in self._lines: line.set_data([], [])
         self.ax1.set_xlim(0, self.window_size); self.ax1.set_ylim(-0.2, 1.5)
-        self.ax1.grid(True, alpha=0.3)
-        self.ax2.set_xlim(0, self.window_size); self.ax2.set_ylim(0, 12)
-        self.ax2.grid(True, alpha=0.3)
-        
-        self.line_target, = self.ax1.plot([], [], 'g--', label="Target", linewidth=2)
-        self.line_pid, = self.ax1.plot([], [], 'r-', label="PID")
-        self.line_tau, = self.ax1.plot([], [], 'b-', label="Tau")
-        self.ax1.legend()
-        
-        self.line_pid_a, = self.ax2.plot([], [], 'r-', alpha=0.5)
-        self.line_tau_a, = self.ax2.plot([], [], 'b-', alpha=0.5)
+        self.ax2.set_xlim(0, self.window_size)
 
-        self.ani = FuncAnimation(self.fig, self.update_frame, interval=50, blit=False)
-        self.canvas.draw()
+        # Blit: axes, grid and legend are cached once; each frame only redraws the five lines
+        self.ani = FuncAnimation(self.fig, self.update_frame, init_func=lambda: self._lines,
+                                 interval=self.speed_var.get(), blit=True, cache_frame_data=False)
+        self.canvas.draw_idle() # Also fires the draw_event FuncAnimation waits on to start its timer
 
     def update_frame(self, frame):
-        if not self.is_running: return
+        if not self.is_running: return self._lines
         
         # 1. PARAMETER UPDATE
-        target = self.target_scale.get()
-        self.pid.kp = self.kp_scale.get()
-        self.pid.ki = self.ki_scale.get()
-        self.pid.kd = self.kd_scale.get()
+        target = self._target # Gains and target are kept current by the slider traces
         
-        noise = np.random.normal(0, 0.01)
+        noise = self._noise_buf[self._noise_idx]
+        self._noise_idx += 1
+        if self._noise_idx == len(self._noise_buf):
+            self._noise_buf = self._rng.normal(0, 0.01, len(self._noise_buf))
+            self._noise_idx = 0
         if self.manual_glitch:
             noise += 2.0
             self.console.log(">> GLITCH INJECTED", "red")
@@ -410,45 +511,49 @@ class TauStudioApp:
         m_p = self.plant_pid.update(self.amp_pid, noise, 1.0)
         m_t = self.plant_tau.update(self.amp_tau, noise, 1.0)
         
-        # 3. CONTROL (Synchronized Step)
-        # PID is fast, Tau is slow. 
-        # By putting them here sequentially, the simulation time 't' 
-        # is effectively paused until Tau returns. 
-        # This guarantees graph alignment.
+        # 3. CONTROL
+        # PID is fast, Tau is slow, so Tau is pipelined: pick up the answer to the
+        # step submitted last frame (Tau worked on it while that frame rendered),
+        # then submit this frame's measurement. Tau's command lands one frame after PID's.
         
-        self.amp_pid = max(0, min(10, self.amp_pid + self.pid.compute(target, m_p)))
+        amp = self.amp_pid + self.pid.compute(target, m_p)
+        self.amp_pid = 0.0 if amp < 0.0 else (10.0 if amp > 10.0 else amp)
         
-        tgt = self.tau_interface.compute(m_t, target)
+        tgt = self.tau_interface.poll()
         if tgt is not None: self.amp_tau = tgt
+        if not self.tau_interface.submit(m_t, target) and self.tau_interface.valid:
+            # Tau is still on last frame's step, so this frame's measurement never reaches it
+            self._tau_skipped += 1
+            if self._tau_skipped % 50 == 1:
+                self.console.log(f">> Tau busy: {self._tau_skipped} measurement(s) skipped", "yellow")
         
         # 4. BUFFERING & SCROLLING
-        self.data_x.append(self.step_idx)
-        self.data_target.append(target)
-        self.data_pid_v.append(m_p)
-        self.data_tau_v.append(m_t)
-        self.data_pid_a.append(self.amp_pid)
-        self.data_tau_a.append(self.amp_tau)
+        sample = (self.step_idx, target, m_p, m_t, self.amp_pid, self.amp_tau)
+        if self._n < self.window_size:
+            self._buf[:, self._n] = sample
+            self._n += 1
+        else: # Full: shift left by one in C and write the new column at the end
+            self._buf[:, :-1] = self._buf[:, 1:]
+            self._buf[:, -1] = sample
         
-        if len(self.data_x) > self.window_size:
-            self.data_x.pop(0)
-            self.data_target.pop(0)
-            self.data_pid_v.pop(0)
-            self.data_tau_v.pop(0)
-            self.data_pid_a.pop(0)
-            self.data_tau_a.pop(0)
-            
-            self.ax1.set_xlim(self.data_x[0], self.data_x[-1] + 10)
-            self.ax2.set_xlim(self.data_x[0], self.data_x[-1] + 10)
+        if self.step_idx >= self.ax1.get_xlim()[1]: # Hit the right edge: page forward half a window
+            lo = self.step_idx - self.window_size // 2
+            self.ax1.set_xlim(lo, lo + self.window_size)
+            self.ax2.set_xlim(lo, lo + self.window_size)
+            # Full (synchronous) redraw of the static parts now, so the blit cache
+            # re-captured for the new view this frame has the new ticks in it
+            self.canvas.draw()
 
         # 5. RENDER
-        self.line_target.set_data(self.data_x, self.data_target)
-        self.line_pid.set_data(self.data_x, self.data_pid_v)
-        self.line_tau.set_data(self.data_x, self.data_tau_v)
-        self.line_pid_a.set_data(self.data_x, self.data_pid_a)
-        self.line_tau_a.set_data(self.data_x, self.data_tau_a)
+        x, target_v, pid_v, tau_v, pid_a, tau_a = self._buf[:, :self._n]
+        self.line_target.set_data(x, target_v)
+        self.line_pid.set_data(x, pid_v)
+        self.line_tau.set_data(x, tau_v)
+        self.line_pid_a.set_data(x, pid_a)
+        self.line_tau_a.set_data(x, tau_a)
         
         self.step_idx += 1
-        self.ani.event_source.interval = int(self.speed_scale.get())
+        return self._lines
 
 if __name__ == "__main__":
     root = tk.Tk()